@@ -1,12 +1,36 @@
 import sqlite3
-import json
 import os
+import ijson
+import orjson
+from functools import lru_cache
+from typing import Any, Dict, List
+
+SQLITE_PRAGMAS = (
+    'PRAGMA synchronous = NORMAL',
+    'PRAGMA temp_store = MEMORY',
+    'PRAGMA mmap_size = 268435456',
+    'PRAGMA cache_size = -65536',
+    'PRAGMA busy_timeout = 5000',
+)
+
+INSERT_BATCH_SIZE = 1000
+
+# Stay well under SQLITE_MAX_VARIABLE_NUMBER, which is 999 on older sqlite builds.
+SQLITE_MAX_KEYS_PER_QUERY = 900
+
+def connect(sqlite3_db_path: str) -> sqlite3.Connection:
+    """ Opens a connection to the db with the pragmas applied. """
+    conn = sqlite3.connect(sqlite3_db_path)
+    for pragma in SQLITE_PRAGMAS:
+        conn.execute(pragma)
+    return conn
 
 def create_or_sqlite3_db(sqlite3_db_path: str, collection_name) -> None:
+    """ Creates the collection as a WITHOUT ROWID table, clustered on _id. """
     try:
-        conn = sqlite3.connect(sqlite3_db_path)
+        conn = connect(sqlite3_db_path)
         cursor = conn.cursor()
-        cursor.execute(f'CREATE TABLE IF NOT EXISTS {collection_name} (_id TEXT PRIMARY KEY, value TEXT)')
+        cursor.execute(f'CREATE TABLE IF NOT EXISTS {collection_name} (_id TEXT PRIMARY KEY, value BLOB) WITHOUT ROWID')
         conn.commit()
     except Exception as e:
         raise ValueError(f'Failed to create or open kv store db: {str(e)}')
@@ -14,27 +38,61 @@ def create_or_sqlite3_db(sqlite3_db_path: str, collection_name) -> None:
 
 
 def move_json_to_sqlite3(json_path: str, sqlite3_db_path: str, collection_name: str) -> None:
+    """
+    Streams every key-value pair of the json file into the collection in a single transaction.
+
+    The file is parsed incrementally and rows are inserted in chunks of INSERT_BATCH_SIZE,
+    so memory use stays bounded no matter how large the file is.
+    """
+    sql = f'INSERT OR REPLACE INTO {collection_name} (_id, value) VALUES (?, ?)'
+    conn = connect(sqlite3_db_path)
     try:
-        with open(json_path, 'r') as file:
-            data = json.load(file)
-        conn = sqlite3.connect(sqlite3_db_path)
-        cursor = conn.cursor()
-        for id, value in data.items():
-            cursor.execute(f'INSERT INTO {collection_name} (_id, value) VALUES (?, ?)', (id, json.dumps(value)))
+        conn.execute('BEGIN')
+        with open(json_path, 'rb') as file:
+            batch = []
+            for id, value in ijson.kvitems(file, '', use_float=True):
+                batch.append((id, orjson.dumps(value)))
+                if len(batch) >= INSERT_BATCH_SIZE:
+                    conn.executemany(sql, batch)
+                    batch.clear()
+            if batch:
+                conn.executemany(sql, batch)
         conn.commit()
     except Exception as e:
+        conn.rollback()
         raise e
+    finally:
+        conn.close()
 
-def retrieve_value_from_sqlite3(sqlite3_db_path: str, collection_name: str, _id: str) -> str:
+@lru_cache(maxsize=None)
+def get_connection(sqlite3_db_path: str) -> sqlite3.Connection:
+    """ Reuses one connection per db, which also reuses sqlite3's compiled statement cache. """
+    return connect(sqlite3_db_path)
+
+def retrieve_value_from_sqlite3(sqlite3_db_path: str, collection_name: str, _id: str) -> Dict[str, Any]:
     try:
-        conn = sqlite3.connect(sqlite3_db_path)
-        cursor = conn.cursor()
-        cursor.execute(f'SELECT value FROM {collection_name} WHERE _id = ?', (_id,))
+        conn = get_connection(sqlite3_db_path)
+        cursor = conn.execute(f'SELECT value FROM {collection_name} WHERE _id = ?', (_id,))
         value = cursor.fetchone()[0]
-        return value
+        return orjson.loads(value)
     except Exception as e:
         raise ValueError(f'Failed to retrieve value from SQLite3: {str(e)}')
 
+def retrieve_values_from_sqlite3(sqlite3_db_path: str, collection_name: str, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """ Retrieves the values with one query per SQLITE_MAX_KEYS_PER_QUERY ids. Ids that aren't found are left out. """
+    values = {}
+    try:
+        conn = get_connection(sqlite3_db_path)
+        for i in range(0, len(ids), SQLITE_MAX_KEYS_PER_QUERY):
+            chunk = ids[i:i + SQLITE_MAX_KEYS_PER_QUERY]
+            placeholders = ', '.join('?' * len(chunk))
+            cursor = conn.execute(f'SELECT _id, value FROM {collection_name} WHERE _id IN ({placeholders})', chunk)
+            for _id, value in cursor.fetchall():
+                values[_id] = orjson.loads(value)
+    except Exception as e:
+        raise ValueError(f'Failed to retrieve values from SQLite3: {str(e)}')
+    return values
+
 
 json_path = 'swarmstar/actions/action_space.json'
 sqlite3_db_path = 'swarmstar/internal_metadata.sqlite3'
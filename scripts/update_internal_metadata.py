@@ -1,12 +1,38 @@
 import sqlite3
-import json
 import os
+import ijson
+import orjson
+
+# The database is rebuilt from scratch and shipped inside the package, so it is left in
+# the default rollback journal mode. A WAL database needs writable -wal/-shm files next
+# to it, which an installed package can't guarantee.
+SQLITE_PRAGMAS = (
+    'PRAGMA synchronous = NORMAL',
+    'PRAGMA temp_store = MEMORY',
+    'PRAGMA mmap_size = 268435456',
+    'PRAGMA cache_size = -65536',
+    'PRAGMA busy_timeout = 5000',
+)
+
+INSERT_BATCH_SIZE = 1000
+
+def connect(sqlite3_db_path: str) -> sqlite3.Connection:
+    """ Opens a connection to the db with the pragmas applied. """
+    conn = sqlite3.connect(sqlite3_db_path)
+    for pragma in SQLITE_PRAGMAS:
+        conn.execute(pragma)
+    return conn
 
 def create_or_open_kv_db(sqlite3_db_path: str, table_name: str) -> None:
+    """
+    Kv tables are WITHOUT ROWID, so the _id primary key is the table's own b-tree. Lookups
+    by _id, including range scans over an _id prefix, read the value straight from it
+    without a separate index.
+    """
     try:
-        conn = sqlite3.connect(sqlite3_db_path)
+        conn = connect(sqlite3_db_path)
         cursor = conn.cursor()
-        cursor.execute(f'CREATE TABLE IF NOT EXISTS {table_name} (_id TEXT PRIMARY KEY, value TEXT)')
+        cursor.execute(f'CREATE TABLE IF NOT EXISTS {table_name} (_id TEXT PRIMARY KEY, value BLOB) WITHOUT ROWID')
         conn.commit()
     except Exception as e:
         raise ValueError(f'Failed to create or open {table_name} in db: {str(e)}')
@@ -14,17 +40,31 @@ def create_or_open_kv_db(sqlite3_db_path: str, table_name: str) -> None:
 
 
 def move_json_to_sqlite3(json_path: str, sqlite3_db_path: str, table_name: str) -> None:
+    """
+    Streams every key-value pair of the json file into the table in a single transaction.
+
+    The file is parsed incrementally and rows are inserted in chunks of INSERT_BATCH_SIZE,
+    so memory use stays bounded no matter how large the file is.
+    """
+    sql = f'INSERT OR REPLACE INTO {table_name} (_id, value) VALUES (?, ?)'
+    conn = connect(sqlite3_db_path)
     try:
-        with open(json_path, 'r') as file:
-            data = json.load(file)
-        conn = sqlite3.connect(sqlite3_db_path)
-        cursor = conn.cursor()
-        for key, value in data.items():
-            prefixed_key = key
-            cursor.execute(f'INSERT INTO {table_name} (_id, value) VALUES (?, ?)', (prefixed_key, json.dumps(value)))
+        conn.execute('BEGIN')
+        with open(json_path, 'rb') as file:
+            batch = []
+            for key, value in ijson.kvitems(file, '', use_float=True):
+                batch.append((key, orjson.dumps(value)))
+                if len(batch) >= INSERT_BATCH_SIZE:
+                    conn.executemany(sql, batch)
+                    batch.clear()
+            if batch:
+                conn.executemany(sql, batch)
         conn.commit()
     except Exception as e:
+        conn.rollback()
         raise e
+    finally:
+        conn.close()
 
 
 sqlite3_db_path = 'swarmstar/internal_metadata.sqlite3'
@@ -1 +1,2 @@
-from .swarmstar import Swarmstar
\ No newline at end of file
+from .swarmstar import Swarmstar
+from .models import OperationType
\ No newline at end of file
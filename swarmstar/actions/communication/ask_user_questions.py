@@ -61,17 +61,46 @@ FINALIZE_REPORT_INSTRUCTIONS = (
     "Consolidate the list of reports into a final report."
 ).replace("\n", "\\n")
 
+# System message templates. The static instructions are joined once here and only the
+# variable parts are filled in with str.format at call time.
+INITIAL_CONVERSATION_STATE_MESSAGE_TEMPLATE = (
+    GENERATE_INITIAL_CONVERSATION_STATE_INSTRUCTIONS
+    + "You are initializing the conversation state. Extract questions and "
+    "context from this message:\n`{message}`"
+)
+
+FIRST_MESSAGE_TEMPLATE = (
+    GENERATE_MESSAGE_INSTRUCTIONS
+    + "Questions: {questions}\n\n"
+    "Context: {persisted_context}\n\n"
+    "Start the conversation off with a message that is clear and concise."
+)
+
+GENERATE_MESSAGE_TEMPLATE = (
+    GENERATE_MESSAGE_INSTRUCTIONS
+    + "Questions: {questions}\n\n"
+    "Context: {persisted_context}\n\n"
+    "User's most recent message: {user_message}\n"
+    "Your most recent message: {recent_ai_message}"
+)
+
+UPDATE_CONVERSATION_STATE_MESSAGE_TEMPLATE = (
+    UPDATE_CONVERSATION_STATE_INSTRUCTIONS
+    + "Update Questions: {questions}\n\n"
+    "Update Context: {persisted_context}\n\n"
+    "Add to Reports: {reports}\n\n"
+    "Your (you, the ais) most recent message: {recent_ai_message}"
+)
+
+FINALIZE_REPORT_MESSAGE_TEMPLATE = FINALIZE_REPORT_INSTRUCTIONS + "\n\nReports: {reports}"
+
 
 class Action(BaseAction):
     def main(self):
         return self.generate_initial_conversation_state()
 
     def generate_initial_conversation_state(self):
-        system_message = (
-            f"{GENERATE_INITIAL_CONVERSATION_STATE_INSTRUCTIONS}"
-            f"You are initializing the conversation state. Extract questions and "
-            f"context from this message:\n`{self.node.message}`"
-        )
+        system_message = INITIAL_CONVERSATION_STATE_MESSAGE_TEMPLATE.format(message=self.node.message)
         messages = [
             {
                 "role": "swarmstar",
@@ -95,11 +124,9 @@ class Action(BaseAction):
         self,
         completion: InitialQuestionAskerConversationState
     ):
-        system_message = (
-            f"{GENERATE_MESSAGE_INSTRUCTIONS}"
-            f"Questions: {completion.questions}\n\n"
-            f"Context: {completion.persisted_context}\n\n"
-            f"Start the conversation off with a message that is clear and concise."
+        system_message = FIRST_MESSAGE_TEMPLATE.format(
+            questions=completion.questions,
+            persisted_context=completion.persisted_context
         )
         messages = [
             {"role": "swarmstar", "content": system_message}
@@ -147,12 +174,11 @@ class Action(BaseAction):
         recent_ai_message = context["recent_ai_message"]
         reports = context["reports"]
 
-        system_message = (
-            f"{GENERATE_MESSAGE_INSTRUCTIONS}"
-            f"Questions: {completion.questions}\n\n"
-            f"Context: {completion.persisted_context}\n\n"
-            f"User's most recent message: {user_message}\n"
-            f"Your most recent message: {recent_ai_message}"
+        system_message = GENERATE_MESSAGE_TEMPLATE.format(
+            questions=completion.questions,
+            persisted_context=completion.persisted_context,
+            user_message=user_message,
+            recent_ai_message=recent_ai_message
         )
         messages = [
             {"role": "swarmstar", "content": system_message}
@@ -197,12 +223,11 @@ class Action(BaseAction):
         recent_ai_message: str,
         user_response: str,
     ):
-        system_message = (
-            f"{UPDATE_CONVERSATION_STATE_INSTRUCTIONS}"
-            f"Update Questions: {questions}\n\n"
-            f"Update Context: {persisted_context}\n\n"
-            f"Add to Reports: {reports}\n\n"
-            f"Your (you, the ais) most recent message: {recent_ai_message}"
+        system_message = UPDATE_CONVERSATION_STATE_MESSAGE_TEMPLATE.format(
+            questions=questions,
+            persisted_context=persisted_context,
+            reports=reports,
+            recent_ai_message=recent_ai_message
         )
         messages = [
             {"role": "swarmstar", "content": system_message},
@@ -244,7 +269,7 @@ class Action(BaseAction):
         )
 
     def finalize_report(self, reports: List[str]):
-        system_message = FINALIZE_REPORT_INSTRUCTIONS + f"\n\nReports: {reports}"
+        system_message = FINALIZE_REPORT_MESSAGE_TEMPLATE.format(reports=reports)
         messages = [{"role": "swarmstar", "content": system_message}]
 
         return BlockingOperation(
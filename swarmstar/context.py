@@ -1,3 +1,6 @@
 import contextvars
 
-swarm_id_var = contextvars.ContextVar('swarm_id')
\ No newline at end of file
+swarm_id_var = contextvars.ContextVar('swarm_id')
+
+# Swarm node reads memoized for the duration of one Swarmstar.execute call. None outside of it.
+swarm_node_cache_var = contextvars.ContextVar('swarm_node_cache', default=None)
@@ -5,6 +5,7 @@ from .swarm.swarmstar_space import SwarmstarSpace
 from .swarm.swarm_tree import SwarmTree
 from .swarm.swarm_nodes import SwarmNode
 from .swarm.swarm_operations import (
+    OperationType,
     SwarmOperation,
     SpawnOperation,
     TerminationOperation,
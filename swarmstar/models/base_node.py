@@ -6,10 +6,11 @@ Swarm nodes, action metadata nodes and memory metadata nodes are all derived fro
 from pydantic import BaseModel, Field, ConfigDict
 from typing import List, Optional, Dict, Any, TypeVar
 from importlib import import_module
+from copy import deepcopy
 
 from swarmstar.utils.database import MongoDBWrapper
 from swarmstar.utils.database.internal import get_internal_sqlite
-from swarmstar.context import swarm_id_var
+from swarmstar.context import swarm_id_var, swarm_node_cache_var
 
 db = MongoDBWrapper()
 
@@ -48,9 +49,18 @@ class BaseNode(BaseModel):
 
         If found internally and of type "portal", prepend the node_id with
         the swarm_id and retrieve from the mongodb database.
+
+        Swarm node reads are memoized for the duration of the swarm operation being
+        executed, see swarm_node_cache_var. Every write through this class drops the
+        cached entry, and callers always get their own copy.
         """
         if cls.collection == "swarm_nodes":
-            return db.read(cls.collection, node_id)
+            cache = swarm_node_cache_var.get()
+            if cache is None:
+                return db.read(cls.collection, node_id)
+            if node_id not in cache:
+                cache[node_id] = db.read(cls.collection, node_id)
+            return deepcopy(cache[node_id])
         else:
             try:
                 node = get_internal_sqlite(cls.collection, node_id)
@@ -67,22 +77,33 @@ class BaseNode(BaseModel):
     @classmethod
     def delete(cls, node_id: str) -> None:
         """ Deletes node from the database."""
+        cls._invalidate_cached_node(node_id)
         db.delete(cls.collection, node_id)
 
     @classmethod
     def update(cls, node_id: str, updated_values: Dict[str, Any]) -> None:
         """ Updates node in the database with updated values."""
+        cls._invalidate_cached_node(node_id)
         db.update(cls.collection, node_id, updated_values)
 
     @classmethod
     def replace(cls, node_id: str, new_node: T) -> None:
         """ Replaces node in the database with new node."""
+        cls._invalidate_cached_node(node_id)
         db.replace(cls.collection, node_id, new_node.model_dump())
 
     def create(self) -> None:
         """ Inserts a node to the database. Raises an error if the node already exists. """
+        self._invalidate_cached_node(self.id)
         db.create(self.collection, self.id, self.model_dump())
 
+    @classmethod
+    def _invalidate_cached_node(cls, node_id: str) -> None:
+        """ Drops the node from the swarm node read cache, if one is active. """
+        cache = swarm_node_cache_var.get()
+        if cache is not None and cls.collection == "swarm_nodes":
+            cache.pop(node_id, None)
+
     def clone(self, swarm_id: str) -> None:
         """ Clones this node under a new swarm id and saves it to the database. """
         parts = self.id.split("_")
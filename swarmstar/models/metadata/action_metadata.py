@@ -14,6 +14,7 @@ from pydantic import Field
 from enum import Enum
 from typing_extensions import Literal
 from importlib import import_module
+from functools import lru_cache
 
 from swarmstar.models.metadata.metadata_node import MetadataNode
 from swarmstar.utils.misc.ids import get_available_id
@@ -45,21 +46,17 @@ class ActionMetadata(MetadataNode):
     @staticmethod
     def get_action_class(action_id: str):
         """ Returns an uninstantiated action class. """
-        action_metadata = ActionMetadata.get(action_id)
-        if action_metadata.is_folder:
-            raise ValueError(f"You tried to get the action class of a folder {action_id}.")
-        
-        if action_metadata.internal:
-            internal_file_path = action_metadata.internal_file_path
-            action_class = getattr(import_module(internal_file_path), "Action")
-            return action_class
-        else:
-            # TODO: Implement this when we have a better idea of how external actions will work.
-            raise ValueError(f"External actions are not supported yet.")
+        return getattr(ActionMetadata.get_action_module(action_id), "Action")
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_action_module(action_id: str):
-        """ Returns the module of the action. """
+        """
+        Returns the module of the action.
+
+        Internal actions can't change at runtime, so the module behind each action id
+        is only resolved once. Errors aren't cached.
+        """
         action_metadata = ActionMetadata.get(action_id)
         if action_metadata.is_folder:
             raise ValueError(f"You tried to get the action module of a folder {action_id}.")
@@ -69,6 +66,7 @@ class ActionMetadata(MetadataNode):
             module = import_module(internal_file_path)
             return module
         else:
+            # TODO: Implement this when we have a better idea of how external actions will work.
             raise ValueError(f"External actions are not supported yet.")
 
 class InternalActionMetadata(ActionMetadata):
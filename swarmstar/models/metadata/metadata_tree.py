@@ -6,11 +6,13 @@ In swarmstar we have two metadata trees: action and memory.
 This allows us to find actions to take, and answers to questions.
 """
 from swarmstar.models.base_tree import BaseTree
-from swarmstar.utils.database.internal import get_internal_sqlite
+from swarmstar.utils.database.internal import get_internal_sqlite, get_internal_sqlite_many
 from swarmstar.utils.database import MongoDBWrapper
 
 db = MongoDBWrapper()
 
+PORTAL_BATCH_SIZE = 500 # Max number of cloned portal nodes sent per batch_create
+
 class MetadataTree(BaseTree):
     @classmethod
     def instantiate(cls, swarm_id: str) -> None:
@@ -44,15 +46,29 @@ class MetadataTree(BaseTree):
 
         batch_create_payload = {} # {new_node_id: new_node}
 
-        def recursive_helper(node):
-            if "type" in node and node.get("portal", False):
-                node_id = f"{swarm_id}_{node['id']}"
-                batch_create_payload[node_id] = node
-            if node.get("children_ids", None):
-                for child_id in node["children_ids"]:
-                    child_node = get_internal_sqlite(cls.collection, child_id)
-                    recursive_helper(child_node)
-
-        recursive_helper(node)
+        # Walk the tree level by level so all children of a level are fetched in one query.
+        # A node reachable from several parents is only fetched and visited once.
+        # A child id with no row raises, like get_internal_sqlite does.
+        visited_ids = {node["id"]}
+        frontier = [node]
+        while frontier:
+            children_ids = []
+            for node in frontier:
+                if "type" in node and node.get("portal", False):
+                    node_id = f"{swarm_id}_{node['id']}"
+                    batch_create_payload[node_id] = node
+                    if len(batch_create_payload) >= PORTAL_BATCH_SIZE:
+                        db.batch_create(cls.collection, batch_create_payload)
+                        batch_create_payload = {}
+                for child_id in node.get("children_ids") or []:
+                    if child_id not in visited_ids:
+                        visited_ids.add(child_id)
+                        children_ids.append(child_id)
+            children = get_internal_sqlite_many(cls.collection, children_ids)
+            frontier = []
+            for child_id in children_ids:
+                if child_id not in children:
+                    raise ValueError(f'No value found for key: {child_id}')
+                frontier.append(children[child_id])
 
         if batch_create_payload: db.batch_create(cls.collection, batch_create_payload)
@@ -73,6 +73,25 @@ class SwarmNode(BaseNode):
 
         :return: The index_key of the log that was added.
         """
+        return_index_key = self._append_log(log_dict, index_key)
+        SwarmNode.replace(self.id, self)
+        return return_index_key
+
+    def log_many(self, log_dicts: List[Dict[str, Any]], index_key: List[int] = None) -> List[List[int]]:
+        """
+        Appends multiple logs in order, exactly as consecutive calls to log would,
+        but saves the node to the database once instead of once per log.
+
+        :param log_dicts: The logs to add, in order.
+        :param index_key: Same as in log. Applied to every log.
+        :return: The index_key of each log that was added.
+        """
+        return_index_keys = [self._append_log(log_dict, index_key) for log_dict in log_dicts]
+        SwarmNode.replace(self.id, self)
+        return return_index_keys
+
+    def _append_log(self, log_dict: Dict[str, Any], index_key: List[int] = None) -> List[int]:
+        """ Appends the log to developer_logs in memory. See log for the index_key semantics. """
         if index_key is None:
             self.developer_logs.append(log_dict)
             return_index_key = [len(self.developer_logs) - 1]
@@ -96,5 +115,4 @@ class SwarmNode(BaseNode):
                         nested_list = nested_list[index]
                     else:
                         raise ValueError("Invalid index_key. Cannot traverse non-list elements.")
-        SwarmNode.replace(self.id, self)
         return return_index_key
@@ -7,8 +7,10 @@ Nodes can perform 1 of 5 "SwarmOperations":
     - UserCommunicationOperation
 """
 from __future__ import annotations
+from enum import IntEnum
 from typing import Any, Dict, Literal, Optional, Union
-from pydantic import BaseModel, Field
+from typing_extensions import Annotated
+from pydantic import BaseModel, Discriminator, Field, Tag, TypeAdapter, field_validator
 from pydantic import ValidationError
 from abc import ABC, abstractmethod
 
@@ -17,30 +19,48 @@ from swarmstar.utils.database import MongoDBWrapper
 
 db = MongoDBWrapper()
 
+class OperationType(IntEnum):
+    """
+    Serialized as an int, both in the database and in json, and doubles as the
+    index into swarmstar.OPERATION_HANDLERS. Only append new members so stored
+    operations keep their meaning.
+
+    The legacy string tags ("spawn", "terminate", "blocking", "user_communication",
+    "action") are still accepted on input, but comparing operation_type against
+    them is always False. Compare against the members instead.
+    """
+    SPAWN = 0
+    TERMINATE = 1
+    BLOCKING = 2
+    USER_COMMUNICATION = 3
+    ACTION = 4
+
+def parse_operation_type(value: Any) -> Any:
+    """ Maps a legacy string tag to its OperationType. Anything else is returned as is. """
+    if isinstance(value, str) and value.upper() in OperationType.__members__:
+        return OperationType[value.upper()]
+    return value
+
 class SwarmOperation(BaseModel, ABC):
     id: Optional[str] = Field(default_factory=lambda: get_available_id("swarm_operations"))
-    operation_type: Literal[
-        "spawn",
-        "terminate",
-        "blocking",
-        "user_communication",
-        "action"
-    ]
+    operation_type: OperationType
+
+    @field_validator("operation_type", mode="before")
+    @classmethod
+    def validate_operation_type(cls, value: Any) -> Any:
+        return parse_operation_type(value)
 
     @classmethod
     def model_validate(cls,data: Union[Dict[str, Any], 'SwarmOperation'], **kwargs) -> 'SwarmOperation':
+        """
+        Already built operations are returned as is. Dicts validated against the base
+        class are validated by swarm_operation_adapter, which picks the subclass from
+        operation_type inside pydantic-core.
+        """
         if isinstance(data, SwarmOperation):
             return data
-        elif isinstance(data, dict):
-            operation_type = data.get('operation_type')
-            operation_mapping = {
-                "blocking": BlockingOperation,
-                "user_communication": UserCommunicationOperation,
-                "spawn": SpawnOperation,
-                "terminate": TerminationOperation,
-                "action": ActionOperation
-            }
-            return operation_mapping[operation_type].model_validate(**data)
+        elif isinstance(data, dict) and cls is SwarmOperation:
+            return swarm_operation_adapter.validate_python(data, **kwargs)
         return super().model_validate(data, **kwargs)
 
     @staticmethod
@@ -56,27 +76,12 @@ class SwarmOperation(BaseModel, ABC):
         operation = db.read("swarm_operations", operation_id)
         if operation is None:
             raise ValueError(f"Operation with id {operation_id} not found")
-        operation_type = operation["operation_type"]
-    
-        operation_mapping = {
-            "blocking": BlockingOperation,
-            "user_communication": UserCommunicationOperation,
-            "spawn": SpawnOperation,
-            "terminate": TerminationOperation,
-            "action": ActionOperation
-        }
-        
-        if operation_type in operation_mapping:
-            try:
-                OperationClass = operation_mapping[operation_type]
-                return OperationClass.model_validate(operation)
-            except ValidationError as e:
-                print(f"Error validating operation {operation} of type {operation_type}")
-                raise e
-            except Exception as e:
-                raise e
-        else:
-            raise ValueError(f"Operation type {operation_type} not recognized")
+
+        try:
+            return swarm_operation_adapter.validate_python(operation)
+        except ValidationError as e:
+            print(f"Error validating operation {operation} of type {operation.get('operation_type')}")
+            raise e
 
     @staticmethod
     def delete(operation_id: str) -> None:
@@ -95,7 +100,7 @@ class SwarmOperation(BaseModel, ABC):
 
 
 class BlockingOperation(SwarmOperation):
-    operation_type: Literal["blocking"] = Field(default="blocking")
+    operation_type: Literal[OperationType.BLOCKING] = Field(default=OperationType.BLOCKING)
     node_id: str
     blocking_type: Literal[
         "instructor_completion",
@@ -110,7 +115,7 @@ class BlockingOperation(SwarmOperation):
         return {"node_id": copy_under_new_swarm_id(self.node_id, new_swarm_id)}
 
 class SpawnOperation(SwarmOperation):
-    operation_type: Literal["spawn"] = Field(default="spawn")
+    operation_type: Literal[OperationType.SPAWN] = Field(default=OperationType.SPAWN)
     action_id: str
     message: Union[str, Dict[str, Any]]
     context: Optional[Dict[str, Any]] = {}
@@ -125,7 +130,7 @@ class SpawnOperation(SwarmOperation):
         }
 
 class ActionOperation(SwarmOperation):
-    operation_type: Literal["action"] = Field(default="action")
+    operation_type: Literal[OperationType.ACTION] = Field(default=OperationType.ACTION)
     function_to_call: str
     node_id: str
     args: Dict[str, Any] = {}
@@ -134,7 +139,7 @@ class ActionOperation(SwarmOperation):
         return {"node_id": copy_under_new_swarm_id(self.node_id, new_swarm_id)}
 
 class TerminationOperation(SwarmOperation):
-    operation_type: Literal["terminate"] = Field(default="terminate")
+    operation_type: Literal[OperationType.TERMINATE] = Field(default=OperationType.TERMINATE)
     terminator_id: str
     node_id: str
     context: Optional[Dict[str, Any]] = None
@@ -146,11 +151,37 @@ class TerminationOperation(SwarmOperation):
         }
 
 class UserCommunicationOperation(SwarmOperation):
-    operation_type: Literal["user_communication"] = Field(default="user_communication")
+    operation_type: Literal[OperationType.USER_COMMUNICATION] = Field(default=OperationType.USER_COMMUNICATION)
     node_id: str
     message: str
     context: Optional[Dict[str, Any]] = {}
     next_function_to_call: str
 
     def get_field_updates_on_copy(self, new_swarm_id: str) -> Dict[str, Any]:
-        return {"node_id": copy_under_new_swarm_id(self.node_id, new_swarm_id)}
\ No newline at end of file
+        return {"node_id": copy_under_new_swarm_id(self.node_id, new_swarm_id)}
+
+def get_operation_type_tag(operation: Union[Dict[str, Any], SwarmOperation]) -> Optional[str]:
+    """ Returns the OperationType name of a dict or operation, or None if it has no valid operation_type. """
+    if isinstance(operation, dict):
+        operation_type = operation.get("operation_type")
+    else:
+        operation_type = getattr(operation, "operation_type", None)
+    try:
+        return OperationType(parse_operation_type(operation_type)).name
+    except (TypeError, ValueError):
+        return None
+
+# Validates a dict into the right SwarmOperation subclass. The union is tagged by
+# operation_type, so pydantic-core picks the subclass directly instead of us dispatching
+# in python. Ints, OperationType members and the legacy string tags are all accepted.
+# An unknown operation_type raises a ValidationError.
+swarm_operation_adapter = TypeAdapter(Annotated[
+    Union[
+        Annotated[BlockingOperation, Tag(OperationType.BLOCKING.name)],
+        Annotated[UserCommunicationOperation, Tag(OperationType.USER_COMMUNICATION.name)],
+        Annotated[SpawnOperation, Tag(OperationType.SPAWN.name)],
+        Annotated[TerminationOperation, Tag(OperationType.TERMINATE.name)],
+        Annotated[ActionOperation, Tag(OperationType.ACTION.name)]
+    ],
+    Discriminator(get_operation_type_tag)
+])
@@ -20,9 +20,8 @@ def execute_action(action_operation: ActionOperation) -> Union[SwarmOperation, L
     node = SwarmNode.read(node_id)
     action_metadata = ActionMetadata.get(node.type)
 
-
     if action_metadata.internal:
-        return execute_internal_action(action_operation)
+        return execute_internal_action(action_operation, node)
     else:
         raise NotImplementedError("External actions are not yet supported")
 
@@ -26,14 +26,16 @@ async def blocking(blocking_operation: BlockingOperation) -> BlockingOperation:
 
     log_index_key = blocking_operation.context.get("log_index_key", None)
 
-    node.log({
-        "role": "swarmstar",
-        "content": message
-    }, log_index_key)
-    node.log({
-        "role": "ai",
-        "content": response.model_dump_json(indent=2)
-    }, log_index_key)
+    node.log_many([
+        {
+            "role": "swarmstar",
+            "content": message
+        },
+        {
+            "role": "ai",
+            "content": response.model_dump_json(indent=2)
+        }
+    ], log_index_key)
 
     return ActionOperation(
         node_id=blocking_operation.node_id,
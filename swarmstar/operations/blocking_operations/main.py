@@ -1,5 +1,6 @@
+from functools import lru_cache
 from importlib import import_module
-from typing import List, Union
+from typing import Callable, List, Union
 import inspect
 
 from swarmstar.models import (
@@ -7,26 +8,29 @@ from swarmstar.models import (
     SwarmOperation
 )
 
+BLOCKING_OPERATION_MODULES = {
+    "instructor_completion": "swarmstar.operations.blocking_operations.instructor",
+    "openai_completion": "swarmstar.operations.blocking_operations.openai",
+    "ask_questions": "swarmstar.operations.blocking_operations.ask_questions"
+}
 
-async def blocking(blocking_operation: BlockingOperation) -> Union[SwarmOperation, List[SwarmOperation]]:
-    blocking_operation_type_map = {
-        "instructor_completion": "swarmstar.operations.blocking_operations.instructor",
-        "openai_completion": "swarmstar.operations.blocking_operations.openai",
-        "ask_questions": "swarmstar.operations.blocking_operations.ask_questions"
-    }
+@lru_cache(maxsize=None)
+def _get_blocking_handler(blocking_operation_type: str) -> Callable[[BlockingOperation], SwarmOperation]:
+    """
+    Imports the blocking operation module on first use and reuses its blocking function after.
+    The modules are imported lazily because they create their ai clients at import.
+    """
+    return import_module(BLOCKING_OPERATION_MODULES[blocking_operation_type]).blocking
 
+async def blocking(blocking_operation: BlockingOperation) -> Union[SwarmOperation, List[SwarmOperation]]:
     blocking_operation_type = blocking_operation.blocking_type
 
-    if blocking_operation_type not in blocking_operation_type_map:
+    if blocking_operation_type not in BLOCKING_OPERATION_MODULES:
         raise ValueError(
-            f"Blocking operation type: `{blocking_operation_type.type}` is not supported."
+            f"Blocking operation type: `{blocking_operation_type}` is not supported."
         )
 
-    blocking_operation_type_module = import_module(
-        blocking_operation_type_map[blocking_operation_type]
-    )
-    
-    blocking_func = blocking_operation_type_module.blocking
+    blocking_func = _get_blocking_handler(blocking_operation_type)
 
     if inspect.iscoroutinefunction(blocking_func):
         output: SwarmOperation = await blocking_func(blocking_operation)
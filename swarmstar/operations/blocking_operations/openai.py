@@ -22,14 +22,16 @@ async def blocking(blocking_operation: BlockingOperation) -> BlockingOperation:
     node = BaseNode.read(blocking_operation.node_id)
     log_index_key = blocking_operation.context.get("log_index_key", None)
 
-    node.log({
-        "role": "swarmstar",
-        "content": message
-    }, log_index_key)
-    node.log({
-        "role": "ai",
-        "content": response
-    }, log_index_key)
+    node.log_many([
+        {
+            "role": "swarmstar",
+            "content": message
+        },
+        {
+            "role": "ai",
+            "content": response
+        }
+    ], log_index_key)
     
     return ActionOperation(
         node_id=blocking_operation.node_id,
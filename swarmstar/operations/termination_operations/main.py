@@ -1,35 +1,37 @@
+from functools import lru_cache
 from importlib import import_module
-from typing import Union
+from typing import Callable, Union
 
 from swarmstar.models import (
     SwarmNode,
     TerminationOperation,
 )
 
-def terminate(termination_operation: TerminationOperation) -> Union[TerminationOperation, None]:
-    termination_policy_map = {
-        "simple": "swarmstar.utils.swarm_operations.termination_operations.simple",
-        "confirm_directive_completion": "swarmstar.utils.swarm_operations.termination_operations.confirm_directive_completion",
-        "custom_termination_handler": "swarmstar.utils.swarm_operations.termination_operations.custom_termination_handler",
-    }
+TERMINATION_POLICY_MODULES = {
+    "simple": "swarmstar.operations.termination_operations.simple",
+    "confirm_directive_completion": "swarmstar.operations.termination_operations.confirm_directive_completion",
+    "custom_termination_handler": "swarmstar.operations.termination_operations.custom_action_termination",
+}
+
+@lru_cache(maxsize=None)
+def _get_termination_handler(termination_policy: str) -> Callable[[TerminationOperation], Union[TerminationOperation, None]]:
+    """ Imports the termination policy module on first use and reuses its terminate function after. """
+    return import_module(TERMINATION_POLICY_MODULES[termination_policy]).terminate
 
+def terminate(termination_operation: TerminationOperation) -> Union[TerminationOperation, None]:
     node_id = termination_operation.node_id
     node = SwarmNode.read(node_id)
     termination_policy = node.termination_policy
 
-    if termination_policy not in termination_policy_map:
+    if termination_policy not in TERMINATION_POLICY_MODULES:
         raise ValueError(
             f"Termination policy: `{termination_policy}` is not supported."
         )
-    else:
-        pass
 
-    termination_policy_module = import_module(
-        termination_policy_map[termination_policy]
-    )
+    termination_handler = _get_termination_handler(termination_policy)
     
     try:
-        output = termination_policy_module.terminate(termination_operation)
+        output = termination_handler(termination_operation)
     except Exception as e:
         print(f"Error in termination policy module: {e}")
         output = None
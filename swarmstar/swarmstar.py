@@ -7,11 +7,15 @@ Following that, just keep feeding operations into the execute function and it wi
 
 Keep in mind that you shouldn't pass UserCommunication operations into the execute function. 
 I've provided a template for how you may handle those in the user_communication_examples folder.
+To filter them out, check `operation.operation_type == OperationType.USER_COMMUNICATION`.
+operation_type is an int enum and is stored as an int, so comparing it to the old
+string tags like "user_communication" is always False.
 """
 from typing import List, Union
 import inspect
 
 from swarmstar.models import (
+    OperationType,
     SwarmOperation,
     SpawnOperation,
     SwarmstarSpace
@@ -22,7 +26,20 @@ from swarmstar.operations import (
     terminate,
     execute_action
 )
-from swarmstar.context import swarm_id_var
+from swarmstar.context import swarm_id_var, swarm_node_cache_var
+
+# User communication operations are handled by the caller.
+OPERATION_HANDLERS_BY_TYPE = {
+    OperationType.SPAWN: spawn,
+    OperationType.TERMINATE: terminate,
+    OperationType.BLOCKING: blocking,
+    OperationType.ACTION: execute_action,
+}
+
+# Indexed by OperationType. OperationType(i) raises if the members aren't numbered 0..n-1.
+OPERATION_HANDLERS = tuple(
+    OPERATION_HANDLERS_BY_TYPE.get(OperationType(i)) for i in range(len(OperationType))
+)
 
 class Swarmstar:
     def __init__(self, swarm_id: str):
@@ -46,30 +63,25 @@ class Swarmstar:
         and returns a list of swarm operations that should be executed next.
         """
         
-        operation_mapping = {
-            "spawn": spawn,
-            "blocking": blocking,
-            "terminate": terminate,
-            "action": execute_action,
-        }
-
-        if swarm_operation.operation_type in operation_mapping:
-            try:
-                operation_handler = operation_mapping[swarm_operation.operation_type]
-                
-                if inspect.iscoroutinefunction(operation_handler):
-                    output = await operation_handler(swarm_operation)
-                else:
-                    output = operation_handler(swarm_operation)   
-     
-            except Exception as e:
-                print(f"Error in execute_swarmstar_operation: {e}")
-                raise e
-        else:
+        operation_handler = OPERATION_HANDLERS[swarm_operation.operation_type]
+        if operation_handler is None:
             raise ValueError(
-                f"Unknown swarm operation type: {swarm_operation.operation_type}"
+                f"Unsupported swarm operation type: {swarm_operation.operation_type.name}"
             )
 
+        # Memoize swarm node reads while this operation executes
+        swarm_node_cache_token = swarm_node_cache_var.set({})
+        try:
+            if inspect.iscoroutinefunction(operation_handler):
+                output = await operation_handler(swarm_operation)
+            else:
+                output = operation_handler(swarm_operation)
+        except Exception as e:
+            print(f"Error in execute_swarmstar_operation: {e}")
+            raise e
+        finally:
+            swarm_node_cache_var.reset(swarm_node_cache_token)
+
         if output is None:
             return None
         elif isinstance(output, SwarmOperation):
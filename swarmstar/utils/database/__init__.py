@@ -1,2 +1,2 @@
 from .mongodb_wrapper import MongoDBWrapper
-from .internal import get_internal_sqlite, get_internal_file_as_string
\ No newline at end of file
+from .internal import get_internal_sqlite, get_internal_sqlite_many, get_internal_file_as_string
\ No newline at end of file
@@ -3,11 +3,43 @@ This file provides methods to retrieve data internal to the swarmstar package.
 
 Sources include the internal sqlite database and internal files.
 """
-from typing import Dict, Any
+from typing import Dict, Any, List
 import sqlite3
-import json
+import orjson
+import threading
 from importlib import resources
 
+# The internal database is read only at runtime, so only read side tuning is applied.
+SQLITE_PRAGMAS = (
+    'PRAGMA temp_store = MEMORY',
+    'PRAGMA mmap_size = 268435456',
+    'PRAGMA cache_size = -65536',
+    'PRAGMA busy_timeout = 5000',
+)
+
+# Stay well under SQLITE_MAX_VARIABLE_NUMBER, which is 999 on older sqlite builds.
+SQLITE_MAX_KEYS_PER_QUERY = 900
+
+_thread_local = threading.local()
+
+
+def _get_internal_sqlite_connection() -> sqlite3.Connection:
+    """
+    Returns this thread's connection to the internal sqlite database, opening it on first use.
+
+    Each thread keeps its own connection, so nothing is shared across threads and lookups
+    skip the per-call connection setup. sqlite3 caches compiled statements per connection,
+    so reusing the connection also means each SELECT is only parsed once.
+    """
+    conn = getattr(_thread_local, 'internal_sqlite_connection', None)
+    if conn is None:
+        with resources.path('swarmstar', 'internal_metadata.sqlite3') as db_path:
+            conn = sqlite3.connect(str(db_path))
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(pragma)
+        _thread_local.internal_sqlite_connection = conn
+    return conn
+
 
 def get_internal_sqlite(category: str, key: str) -> Dict[str, Any]:
     """
@@ -18,20 +50,42 @@ def get_internal_sqlite(category: str, key: str) -> Dict[str, Any]:
     :return: The value for the key.
     """
     try:
-        with resources.path('swarmstar', f'internal_metadata.sqlite3') as db_path:
-            conn = sqlite3.connect(str(db_path))
-            cursor = conn.cursor()
-            key = key
-            cursor.execute(f'SELECT value FROM {category} WHERE _id = ?', (key,))
-            result = cursor.fetchone()
-            if result:
-                result = json.loads(result[0])
+        conn = _get_internal_sqlite_connection()
+        cursor = conn.execute(f'SELECT value FROM {category} WHERE _id = ?', (key,))
+        result = cursor.fetchone()
+        if result:
+            result = orjson.loads(result[0])
+            result['id'] = key
+            return result
+        else:
+            raise ValueError(f'No value found for key: {key}')
+    except Exception as e:
+        raise ValueError(f'Failed to retrieve kv value: {str(e)}')
+
+
+def get_internal_sqlite_many(category: str, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Retrieves multiple key-value pairs from the internal sqlite database
+    with one query per SQLITE_MAX_KEYS_PER_QUERY keys.
+
+    :param category: The table to retrieve the values from.
+    :param keys: The keys to retrieve the values for.
+    :return: {key: value} for every key that was found. Missing keys are left out.
+    """
+    results = {}
+    try:
+        conn = _get_internal_sqlite_connection()
+        for i in range(0, len(keys), SQLITE_MAX_KEYS_PER_QUERY):
+            chunk = keys[i:i + SQLITE_MAX_KEYS_PER_QUERY]
+            placeholders = ', '.join('?' * len(chunk))
+            cursor = conn.execute(f'SELECT _id, value FROM {category} WHERE _id IN ({placeholders})', chunk)
+            for key, value in cursor.fetchall():
+                result = orjson.loads(value)
                 result['id'] = key
-                return result
-            else:
-                raise ValueError(f'No value found for key: {key}')
+                results[key] = result
     except Exception as e:
-        raise ValueError(f'Failed to retrieve kv value: {str(e)} at {db_path}')
+        raise ValueError(f'Failed to retrieve kv values: {str(e)}')
+    return results
 
 
 def get_internal_file_as_string(file_name: str) -> str:
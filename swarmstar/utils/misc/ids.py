@@ -42,9 +42,11 @@ def get_available_id(collection: str) -> str:
         inner_key = "action_count"
     else: raise ValueError(f"Collection {collection} not recognized.")
 
-    y = db.get_field("admin", swarm_id_var.get(), inner_key)
-    db.increment("admin", swarm_id_var.get(), inner_key)
-    return f"{swarm_id_var.get()}_{x}{y}"
+    # increment is atomic and returns the count before incrementing, so one round trip
+    # both reserves and returns the next index, even with concurrent callers.
+    swarm_id = swarm_id_var.get()
+    y = db.increment("admin", swarm_id, inner_key)
+    return f"{swarm_id}_{x}{y}"
 
 def get_x_given_collection(collection: str) -> str:
     if collection == "swarm_nodes": return "n"